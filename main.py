@@ -5,28 +5,63 @@ Deployed on Railway.app for persistent public URL.
 """
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from contextlib import asynccontextmanager
 from datetime import datetime
-import json
+import orjson
 import uuid
 import os
-import httpx
+import time
+import aiohttp
 import asyncio
+import zstandard as zstd
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from redis import asyncio as aioredis
+from typing import Deque, Literal, Optional, Dict, Any, List
 
-app = FastAPI(title="Phase 1C Signals Backend", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One shared session for all Telegram sends — reuses TCP/TLS connections
+    # instead of paying a fresh handshake per ingest.
+    app.state.tg_session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    # Strong refs to in-flight background sends so they survive GC
+    app.state.bg_tasks = set()
+    app.state.redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+    LOG_BUFFER.extend(load_recent_signals())
+    app.state.log_flusher = asyncio.create_task(_log_flusher())
+    yield
+    # Drain any sends still in flight before closing the session
+    await asyncio.gather(*app.state.bg_tasks, return_exceptions=True)
+    await app.state.tg_session.close()
+    app.state.log_flusher.cancel()
+    await asyncio.gather(app.state.log_flusher, return_exceptions=True)
+    await _flush_log_pending()
+    await app.state.redis.aclose()
+
+
+app = FastAPI(
+    title="Phase 1C Signals Backend",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configuration — cloud-friendly paths
 DATA_DIR = Path(os.getenv("DATA_DIR", "/tmp"))
-SIGNALS_LOG = DATA_DIR / "signals-log.json"
+SIGNALS_LOG = DATA_DIR / "signals-log.jsonl.zst"
 
-# In-memory storage (Railway has ephemeral disk)
-signals_store: Dict[str, Dict] = {}
-approval_status: Dict[str, str] = {}
+# Signal storage — Redis so state survives restarts and is shared across workers
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+SIGNAL_TTL = 86400  # seconds
+SIGNAL_STATUSES = ("APPROVED", "PENDING", "REJECTED")
 
 # Approved assets (Phase 1 watchlist)
-APPROVED_ASSETS = {
+APPROVED_ASSETS = frozenset({
     "BTC", "BTCUSD", "BTCUSDT", "XBT", "XBTUSD",
     "ETH", "ETHUSD", "ETHUSDT",
     "XRP", "XRPUSD", "XRPUSDT",
@@ -37,7 +72,11 @@ APPROVED_ASSETS = {
     "BNB", "BNBUSD", "BNBUSDT",
     "AVAX", "AVAXUSD", "AVAXUSDT",
     "FTM", "FTMUSD", "FTMUSDT",
-}
+})
+
+# The watchlist never mutates at runtime — serve pre-serialized bytes
+_WATCHLIST_PAYLOAD = {"approved_assets": sorted(APPROVED_ASSETS), "count": len(APPROVED_ASSETS)}
+_WATCHLIST_JSON = orjson.dumps(_WATCHLIST_PAYLOAD)
 
 # Risk rules
 RR_RATIO_MIN = 1.5
@@ -48,36 +87,76 @@ CONFIDENCE_PENDING = 6
 # Telegram config
 TELEGRAM_CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID", "-100376135844447")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "NOT_CONFIGURED")
+# Telegram allows ~20 messages/min per channel; stay under it locally
+TELEGRAM_RATE_LIMIT = 20
+TELEGRAM_RATE_WINDOW = 60.0
+
+
+class TokenBucket:
+    """Async token bucket: `rate` sends per `window` seconds"""
 
+    def __init__(self, rate: int, window: float) -> None:
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / window
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
 
-async def send_telegram(message: str, parse_mode: str = "HTML"):
-    """Send message to Telegram channel"""
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.fill_rate)
+
+
+_tg_limiter = TokenBucket(TELEGRAM_RATE_LIMIT, TELEGRAM_RATE_WINDOW)
+
+
+async def send_telegram(message: str, session: aiohttp.ClientSession, parse_mode: str = "HTML") -> bool:
+    """Send message to Telegram channel using the shared session"""
     if TELEGRAM_BOT_TOKEN == "NOT_CONFIGURED":
         print(f"[TELEGRAM SKIP] Bot token not configured. Message: {message[:100]}")
         return False
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    payload = {
+        "chat_id": TELEGRAM_CHANNEL_ID,
+        "text": message,
+        "parse_mode": parse_mode,
+    }
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(url, json={
-                "chat_id": TELEGRAM_CHANNEL_ID,
-                "text": message,
-                "parse_mode": parse_mode,
-            })
-            if resp.status_code == 200:
-                print(f"[TELEGRAM OK] Sent to {TELEGRAM_CHANNEL_ID}")
-                return True
-            else:
-                print(f"[TELEGRAM ERR] {resp.status_code}: {resp.text}")
+        for attempt in range(2):
+            await _tg_limiter.acquire()
+            async with session.post(url, json=payload) as resp:
+                if resp.status == 200:
+                    print(f"[TELEGRAM OK] Sent to {TELEGRAM_CHANNEL_ID}")
+                    return True
+                if resp.status == 429 and attempt == 0:
+                    data = await resp.json()
+                    retry_after = data.get("parameters", {}).get("retry_after", 1)
+                    print(f"[TELEGRAM 429] Retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+                print(f"[TELEGRAM ERR] {resp.status}: {await resp.text()}")
                 return False
+        return False
     except Exception as e:
         print(f"[TELEGRAM ERR] {e}")
         return False
 
 
+_SIDE_EMOJI = {"LONG": "🟢", "SHORT": "🔴"}
+_STATUS_EMOJI = {"APPROVED": "✅", "PENDING": "⏳", "REJECTED": "❌"}
+
+
 def format_signal_telegram(sig: Dict) -> str:
     """Format signal for Telegram message"""
-    emoji = "🟢" if sig["signal_type"] == "LONG" else "🔴"
-    status_emoji = {"APPROVED": "✅", "PENDING": "⏳", "REJECTED": "❌"}.get(sig["status"], "❓")
+    emoji = _SIDE_EMOJI.get(sig["signal_type"], "⚪")
+    status_emoji = _STATUS_EMOJI.get(sig["status"], "❓")
     return (
         f"{emoji} <b>{sig['signal_type']} {sig['asset']}</b> {status_emoji}\n"
         f"📊 Entry: <code>{sig['entry_price']}</code>\n"
@@ -89,81 +168,146 @@ def format_signal_telegram(sig: Dict) -> str:
     )
 
 
-def log_signal(signal_record: Dict):
-    """Append signal to JSON log file"""
+# Recent signals held in memory; the flusher task persists them in batches
+LOG_BUFFER: Deque[Dict] = deque(maxlen=500)
+LOG_FLUSH_INTERVAL = 5.0  # seconds
+_log_dirty = False
+_ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+
+
+def _write_log_snapshot(records: List[Dict]) -> None:
+    """Blocking compressed snapshot write — only called from a worker thread"""
+    payload = b"".join(orjson.dumps(r) + b"\n" for r in records)
+    SIGNALS_LOG.write_bytes(_ZSTD_COMPRESSOR.compress(payload))
+
+
+def log_signal(signal_record: Dict) -> None:
+    """Buffer signal in memory; the background flusher persists it"""
+    global _log_dirty
+    LOG_BUFFER.append(signal_record)
+    _log_dirty = True
+
+
+async def _flush_log_pending() -> None:
+    global _log_dirty
+    if not _log_dirty:
+        return
+    _log_dirty = False
     try:
-        if SIGNALS_LOG.exists():
-            data = json.loads(SIGNALS_LOG.read_text())
-        else:
-            data = []
-        data.append(signal_record)
-        if len(data) > 500:
-            data = data[-500:]
-        SIGNALS_LOG.write_text(json.dumps(data, indent=2))
+        await asyncio.to_thread(_write_log_snapshot, list(LOG_BUFFER))
     except Exception as e:
         print(f"[LOG ERR] {e}")
 
 
-class SignalProcessor:
-    def __init__(self):
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-
-    def validate(self, payload: Dict[str, Any]) -> tuple[bool, Dict[str, Any]]:
-        self.errors.clear()
-        self.warnings.clear()
+async def _log_flusher() -> None:
+    """Periodically flush buffered signals to the JSONL log"""
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        await _flush_log_pending()
 
-        required = ["asset", "signal_type", "entry_price", "stop_loss", "take_profit", "rr_ratio", "confidence_score"]
-        for field in required:
-            if field not in payload:
-                self.errors.append(f"Missing required field: {field}")
 
-        if self.errors:
-            return False, {"errors": self.errors}
-
-        asset = payload.get("asset", "").upper()
-        if asset not in APPROVED_ASSETS:
-            self.errors.append(f"Asset '{asset}' not in approved watchlist")
+def load_recent_signals(limit: int = 500) -> Deque[Dict]:
+    """Read the compressed JSONL log back for recovery after restart"""
+    recent: Deque[Dict] = deque(maxlen=limit)
+    try:
+        if SIGNALS_LOG.exists():
+            raw = zstd.ZstdDecompressor().decompress(SIGNALS_LOG.read_bytes())
+            for line in raw.splitlines():
+                if line.strip():
+                    recent.append(orjson.loads(line))
+    except Exception as e:
+        print(f"[LOG ERR] {e}")
+    return recent
 
-        signal_type = payload.get("signal_type", "").upper()
-        if signal_type not in ["LONG", "SHORT"]:
-            self.errors.append(f"signal_type must be LONG or SHORT, got '{signal_type}'")
 
-        try:
-            entry = float(payload.get("entry_price"))
-            stop = float(payload.get("stop_loss"))
-            target = float(payload.get("take_profit"))
-            if signal_type == "LONG":
-                if entry >= target:
-                    self.errors.append(f"LONG: entry ({entry}) must be < target ({target})")
-                if entry <= stop:
-                    self.errors.append(f"LONG: entry ({entry}) must be > stop ({stop})")
-            elif signal_type == "SHORT":
-                if entry <= target:
-                    self.errors.append(f"SHORT: entry ({entry}) must be > target ({target})")
-                if entry >= stop:
-                    self.errors.append(f"SHORT: entry ({entry}) must be < stop ({stop})")
-        except (TypeError, ValueError):
-            self.errors.append("Prices must be numeric")
+_SIGNAL_NUMERIC_FIELDS = {
+    "entry_price": float,
+    "stop_loss": float,
+    "take_profit": float,
+    "rr_ratio": float,
+    "confidence_score": int,
+}
 
-        try:
-            rr = float(payload.get("rr_ratio"))
-            if rr < RR_RATIO_MIN:
-                self.warnings.append(f"RR ratio {rr} below minimum {RR_RATIO_MIN}")
-        except (TypeError, ValueError):
-            self.errors.append("RR ratio must be numeric")
 
-        try:
-            confidence = int(payload.get("confidence_score"))
-            if confidence < 0 or confidence > 10:
-                self.errors.append(f"Confidence score must be 0-10, got {confidence}")
-        except (TypeError, ValueError):
-            self.errors.append("Confidence score must be integer")
+def _decode_signal(raw: Dict[str, str]) -> Dict:
+    """Rebuild numeric types on a signal hash read back from Redis.
+
+    Internal fields (underscore-prefixed, e.g. the cached Telegram HTML)
+    are dropped from API responses.
+    """
+    return {k: _SIGNAL_NUMERIC_FIELDS[k](v) if k in _SIGNAL_NUMERIC_FIELDS else v
+            for k, v in raw.items() if not k.startswith("_")}
+
+
+async def _fetch_signals(r: aioredis.Redis, signal_ids: List[str]) -> List[Dict]:
+    """Pipelined HGETALL for a batch of signal ids, reaping expired entries"""
+    if not signal_ids:
+        return []
+    pipe = r.pipeline()
+    for signal_id in signal_ids:
+        pipe.hgetall(f"sig:{signal_id}")
+    raws = await pipe.execute()
+    signals = []
+    stale = []
+    for signal_id, raw in zip(signal_ids, raws):
+        if raw:
+            signals.append(_decode_signal(raw))
+        else:
+            stale.append(signal_id)
+    if stale:
+        # The hash hit its TTL but the index sets kept the id; drop it so
+        # /stats (pure SCARD) agrees with what the listings return
+        pipe = r.pipeline()
+        pipe.srem("sig:ids", *stale)
+        for s in SIGNAL_STATUSES:
+            pipe.srem(f"sig:status:{s}", *stale)
+        await pipe.execute()
+    return signals
+
+
+class SignalIn(BaseModel):
+    """Validated signal payload — coercion and constraint checks run in pydantic-core"""
+
+    asset: str
+    signal_type: Literal["LONG", "SHORT"]
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    rr_ratio: float
+    confidence_score: int = Field(ge=0, le=10)
+
+    @field_validator("asset", "signal_type", mode="before")
+    @classmethod
+    def _uppercase(cls, v: Any) -> Any:
+        return v.upper() if isinstance(v, str) else v
+
+    @field_validator("asset")
+    @classmethod
+    def _asset_approved(cls, v: str) -> str:
+        if v not in APPROVED_ASSETS:
+            raise ValueError(f"Asset '{v}' not in approved watchlist")
+        return v
+
+    @model_validator(mode="after")
+    def _price_order(self) -> "SignalIn":
+        entry, stop, target = self.entry_price, self.stop_loss, self.take_profit
+        problems = []
+        if self.signal_type == "LONG":
+            if entry >= target:
+                problems.append(f"LONG: entry ({entry}) must be < target ({target})")
+            if entry <= stop:
+                problems.append(f"LONG: entry ({entry}) must be > stop ({stop})")
+        else:
+            if entry <= target:
+                problems.append(f"SHORT: entry ({entry}) must be > target ({target})")
+            if entry >= stop:
+                problems.append(f"SHORT: entry ({entry}) must be < stop ({stop})")
+        if problems:
+            raise ValueError("; ".join(problems))
+        return self
 
-        if self.errors:
-            return False, {"errors": self.errors, "warnings": self.warnings}
-        return True, {"valid": True, "warnings": self.warnings}
 
+class SignalProcessor:
     @staticmethod
     def determine_status(confidence_score: int, rr_ratio: float) -> str:
         if confidence_score >= CONFIDENCE_AUTO_APPROVE and rr_ratio >= 2.0:
@@ -174,7 +318,38 @@ class SignalProcessor:
             return "REJECTED"
 
 
-processor = SignalProcessor()
+def translate_pine(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a Pine Script webhook payload into the native signal shape.
+
+    Raises ValueError if the price fields are missing or non-numeric.
+    """
+    try:
+        entry = float(payload["entry"])
+        stop = float(payload["stop"])
+        tp1 = float(payload["tp1"])
+        score = int(payload.get("score", 0))
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Pine webhook requires numeric entry, stop, and tp1")
+    side = payload.get("side", "LONG").upper()
+    # Signed risk/reward per side; validation rejects mis-ordered prices later
+    if side == "SHORT":
+        risk = stop - entry
+        reward = entry - tp1
+    else:
+        risk = entry - stop
+        reward = tp1 - entry
+    rr = round(reward / risk, 2) if risk > 0 else 0
+    return {
+        "asset": payload.get("symbol", ""),
+        "signal_type": side,
+        "entry_price": entry,
+        "stop_loss": stop,
+        "take_profit": tp1,
+        "rr_ratio": rr,
+        "confidence_score": score,
+        "timeframe": payload.get("timeframe", ""),
+        "strategy": payload.get("strategy", "Universal Signal Engine"),
+    }
 
 
 @app.get("/health")
@@ -189,67 +364,65 @@ async def health():
 
 @app.post("/signals/ingest")
 async def ingest_signal(request: Request):
+    body = await request.body()
     try:
-        payload = await request.json()
-    except:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     # Translate Pine Script webhook format
     if "symbol" in payload and "asset" not in payload:
-        entry = float(payload.get("entry", 0))
-        stop = float(payload.get("stop", 0))
-        tp1 = float(payload.get("tp1", 0))
-        side = payload.get("side", "LONG").upper()
-        risk = abs(entry - stop) if entry and stop else 1
-        reward = abs(tp1 - entry) if tp1 and entry else 0
-        rr = round(reward / risk, 2) if risk > 0 else 0
-        payload = {
-            "asset": payload.get("symbol", ""),
-            "signal_type": side,
-            "entry_price": entry,
-            "stop_loss": stop,
-            "take_profit": tp1,
-            "rr_ratio": rr,
-            "confidence_score": int(payload.get("score", 0)),
-            "timeframe": payload.get("timeframe", ""),
-            "strategy": payload.get("strategy", "Universal Signal Engine"),
-        }
-
-    valid, validation_result = processor.validate(payload)
-    if not valid:
+        try:
+            payload = translate_pine(payload)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        sig = SignalIn.model_validate(payload)
+    except ValidationError as e:
         return JSONResponse(status_code=400, content={
             "status": "rejected",
             "reason": "validation_failed",
-            "errors": validation_result.get("errors"),
+            "errors": [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}".lstrip(": ")
+                       for err in e.errors(include_url=False)],
         })
 
-    confidence = int(payload.get("confidence_score"))
-    rr_ratio = float(payload.get("rr_ratio"))
-    status = processor.determine_status(confidence, rr_ratio)
+    status = SignalProcessor.determine_status(sig.confidence_score, sig.rr_ratio)
 
-    signal_id = f"SIG-{str(uuid.uuid4())[:8].upper()}"
+    signal_id = f"SIG-{uuid.uuid4().hex[:8].upper()}"
     timestamp = datetime.utcnow().isoformat() + "Z"
 
     signal_record = {
         "id": signal_id,
         "timestamp": timestamp,
-        "asset": payload.get("asset").upper(),
-        "signal_type": payload.get("signal_type").upper(),
-        "entry_price": float(payload.get("entry_price")),
-        "stop_loss": float(payload.get("stop_loss")),
-        "take_profit": float(payload.get("take_profit")),
-        "rr_ratio": rr_ratio,
-        "confidence_score": confidence,
+        "asset": sig.asset,
+        "signal_type": sig.signal_type,
+        "entry_price": sig.entry_price,
+        "stop_loss": sig.stop_loss,
+        "take_profit": sig.take_profit,
+        "rr_ratio": sig.rr_ratio,
+        "confidence_score": sig.confidence_score,
         "status": status,
     }
 
-    signals_store[signal_id] = signal_record
-    approval_status[signal_id] = status
+    # Cache the formatted Telegram HTML alongside the record so re-sends and
+    # audit displays never re-format
+    telegram_msg = format_signal_telegram(signal_record)
+
+    r = request.app.state.redis
+    pipe = r.pipeline()
+    pipe.hset(f"sig:{signal_id}", mapping=signal_record)
+    pipe.hset(f"sig:{signal_id}", "_tg_html", telegram_msg)
+    pipe.expire(f"sig:{signal_id}", SIGNAL_TTL)
+    pipe.sadd(f"sig:status:{status}", signal_id)
+    pipe.sadd("sig:ids", signal_id)
+    await pipe.execute()
     log_signal(signal_record)
 
-    # Send to Telegram
-    telegram_msg = format_signal_telegram(signal_record)
-    await send_telegram(telegram_msg)
+    # Send to Telegram in the background — the webhook caller only needs the ack
+    task = asyncio.create_task(send_telegram(telegram_msg, request.app.state.tg_session))
+    request.app.state.bg_tasks.add(task)
+    task.add_done_callback(request.app.state.bg_tasks.discard)
 
     return JSONResponse(
         status_code=200 if status != "REJECTED" else 202,
@@ -263,67 +436,86 @@ async def ingest_signal(request: Request):
 
 
 @app.get("/signals/pending")
-async def get_pending_signals():
-    pending = [s for s in signals_store.values() if approval_status.get(s["id"]) == "PENDING"]
+async def get_pending_signals(request: Request):
+    r = request.app.state.redis
+    pending = await _fetch_signals(r, list(await r.smembers("sig:status:PENDING")))
     return {"count": len(pending), "signals": pending}
 
 
 @app.get("/signals/approved")
-async def get_approved_signals():
-    approved = [s for s in signals_store.values() if approval_status.get(s["id"]) == "APPROVED"]
+async def get_approved_signals(request: Request):
+    r = request.app.state.redis
+    approved = await _fetch_signals(r, list(await r.smembers("sig:status:APPROVED")))
     return {"count": len(approved), "signals": approved}
 
 
 @app.post("/signals/{signal_id}/approve")
-async def approve_signal(signal_id: str):
-    if signal_id not in signals_store:
+async def approve_signal(signal_id: str, request: Request):
+    r = request.app.state.redis
+    if not await r.exists(f"sig:{signal_id}"):
         raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
-    if approval_status.get(signal_id) != "PENDING":
+    if not await r.srem("sig:status:PENDING", signal_id):
         raise HTTPException(status_code=400, detail=f"Signal {signal_id} is not pending")
-    approval_status[signal_id] = "APPROVED"
-    signals_store[signal_id]["status"] = "APPROVED"
+    pipe = r.pipeline()
+    pipe.hset(f"sig:{signal_id}", "status", "APPROVED")
+    pipe.sadd("sig:status:APPROVED", signal_id)
+    await pipe.execute()
+    # Status changed — refresh the cached Telegram HTML once
+    record = _decode_signal(await r.hgetall(f"sig:{signal_id}"))
+    await r.hset(f"sig:{signal_id}", "_tg_html", format_signal_telegram(record))
     return {"status": "approved", "signal_id": signal_id}
 
 
 @app.post("/signals/{signal_id}/reject")
-async def reject_signal(signal_id: str, reason: Optional[str] = None):
-    if signal_id not in signals_store:
+async def reject_signal(signal_id: str, request: Request, reason: Optional[str] = None):
+    r = request.app.state.redis
+    if not await r.exists(f"sig:{signal_id}"):
         raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
-    if approval_status.get(signal_id) != "PENDING":
+    if not await r.srem("sig:status:PENDING", signal_id):
         raise HTTPException(status_code=400, detail=f"Signal {signal_id} is not pending")
-    approval_status[signal_id] = "REJECTED"
-    signals_store[signal_id]["status"] = "REJECTED"
+    pipe = r.pipeline()
+    pipe.hset(f"sig:{signal_id}", "status", "REJECTED")
+    pipe.sadd("sig:status:REJECTED", signal_id)
+    await pipe.execute()
+    # Status changed — refresh the cached Telegram HTML once
+    record = _decode_signal(await r.hgetall(f"sig:{signal_id}"))
+    await r.hset(f"sig:{signal_id}", "_tg_html", format_signal_telegram(record))
     return {"status": "rejected", "signal_id": signal_id, "reason": reason}
 
 
 @app.get("/signals/{signal_id}")
-async def get_signal(signal_id: str):
-    if signal_id not in signals_store:
+async def get_signal(signal_id: str, request: Request):
+    raw = await request.app.state.redis.hgetall(f"sig:{signal_id}")
+    if not raw:
         raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
-    return signals_store[signal_id]
+    return _decode_signal(raw)
 
 
 @app.get("/signals")
-async def list_signals(status: Optional[str] = None, limit: int = 50):
-    signals = list(signals_store.values())
-    if status:
-        signals = [s for s in signals if approval_status.get(s["id"]) == status]
+async def list_signals(request: Request, status: Optional[str] = None, limit: int = 50):
+    r = request.app.state.redis
+    key = f"sig:status:{status}" if status else "sig:ids"
+    signals = await _fetch_signals(r, list(await r.smembers(key)))
     return {"count": len(signals), "signals": signals[:limit]}
 
 
 @app.get("/watchlist")
 async def get_watchlist():
-    return {"approved_assets": sorted(list(APPROVED_ASSETS)), "count": len(APPROVED_ASSETS)}
+    return Response(_WATCHLIST_JSON, media_type="application/json")
 
 
 @app.get("/stats")
-async def get_stats():
-    total = len(signals_store)
+async def get_stats(request: Request):
+    pipe = request.app.state.redis.pipeline()
+    pipe.scard("sig:ids")
+    for s in SIGNAL_STATUSES:
+        pipe.scard(f"sig:status:{s}")
+    total, approved, pending, rejected = await pipe.execute()
     return {
         "total_signals": total,
-        "approved": len([s for s in signals_store.values() if approval_status.get(s["id"]) == "APPROVED"]),
-        "pending": len([s for s in signals_store.values() if approval_status.get(s["id"]) == "PENDING"]),
-        "rejected": len([s for s in signals_store.values() if approval_status.get(s["id"]) == "REJECTED"]),
+        "approved": approved,
+        "pending": pending,
+        "rejected": rejected,
         "telegram_configured": TELEGRAM_BOT_TOKEN != "NOT_CONFIGURED",
     }
 
@@ -347,4 +539,14 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "8001"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Signal state lives in Redis, but the log snapshot file and the
+    # Telegram rate limiter are still per-process — keep one worker unless
+    # WEB_CONCURRENCY explicitly overrides it
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )